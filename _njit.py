@@ -0,0 +1,21 @@
+"""Optional Numba support.
+
+Exposes a ``njit`` decorator that JIT-compiles with Numba when it is
+installed and falls back to the plain Python function otherwise, so the
+hot numeric kernels work without adding a hard dependency.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op replacement for numba.njit when Numba is not installed."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
@@ -1,13 +1,6 @@
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import plotly.express as px
-from datetime import datetime, timedelta
-import time
-from data_fetcher import DataFetcher
-from sentiment_analyzer import SentimentAnalyzer
-from trading_signals import TradingSignalGenerator
+from datetime import date, datetime, timedelta
+from streamlit_autorefresh import st_autorefresh
 
 # Set page config
 st.set_page_config(
@@ -69,18 +62,23 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Initialize components
+# Initialize components lazily: each singleton is built (and its module
+# imported) the first time a tab actually needs it, so cold start doesn't
+# pay the pandas/plotly/NLTK import tax up front
 @st.cache_resource
-def init_components():
-    try:
-        return {
-            'data_fetcher': DataFetcher(),
-            'sentiment_analyzer': SentimentAnalyzer(),
-            'signal_generator': TradingSignalGenerator()
-        }
-    except Exception as e:
-        st.error(f"Error initializing components: {str(e)}")
-        return None
+def get_data_fetcher():
+    from data_fetcher import DataFetcher
+    return DataFetcher()
+
+@st.cache_resource
+def get_sentiment_analyzer():
+    from sentiment_analyzer import SentimentAnalyzer
+    return SentimentAnalyzer()
+
+@st.cache_resource
+def get_signal_generator():
+    from trading_signals import TradingSignalGenerator
+    return TradingSignalGenerator()
 
 # Main title and description
 st.title("📈 Financial Sentiment Trading Dashboard")
@@ -92,13 +90,65 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# Initialize components
-components = init_components()
-
-if not components:
+# The data fetcher validates the API keys, so build it up front
+try:
+    get_data_fetcher()
+except Exception as e:
+    st.error(f"Error initializing components: {str(e)}")
     st.error("Failed to initialize the application. Please check your API keys in the .env file.")
     st.stop()
 
+# Cached data access
+# Streamlit caches on the function arguments, so repeated calls for the same
+# symbol within the TTL are served from memory instead of hitting the
+# Alpha Vantage / News API quotas again. persist="disk" additionally keeps the
+# pickled results across app restarts, so a redeploy doesn't re-fetch
+# everything on the first click.
+@st.cache_data(ttl=300, max_entries=128, show_spinner=False, persist="disk")
+def fetch_stock_data_cached(symbol):
+    return get_data_fetcher().fetch_stock_data(symbol)
+
+# News for a symbol is stable within a day, so the cache key is bucketed by
+# date: one disk entry per symbol per day
+@st.cache_data(ttl=24 * 3600, max_entries=128, show_spinner=False, persist="disk")
+def _fetch_news_for_day(symbol, day_bucket):
+    return get_data_fetcher().fetch_news(symbol)
+
+def fetch_news_cached(symbol):
+    return _fetch_news_for_day(symbol, date.today().isoformat())
+
+@st.cache_data(ttl=300, max_entries=32, show_spinner=False, persist="disk")
+def fetch_stock_data_many_cached(symbols):
+    return get_data_fetcher().fetch_stock_data_many(list(symbols))
+
+@st.cache_data(ttl=300, max_entries=32, show_spinner=False, persist="disk")
+def fetch_news_many_cached(symbols):
+    return get_data_fetcher().fetch_news_many(list(symbols))
+
+# The cache key is the tuple of article URLs/texts rather than the raw
+# article dicts, so Streamlit hashes a few strings instead of re-hashing
+# every field (dates included) on each call
+@st.cache_data(ttl=300, max_entries=256, show_spinner=False)
+def _analyze_news_cached(urls, titles, contents):
+    articles = [
+        {'url': url, 'title': title, 'content': content}
+        for url, title, content in zip(urls, titles, contents)
+    ]
+    return get_sentiment_analyzer().analyze_news_batch(articles)
+
+def analyze_news_cached(news_data):
+    return _analyze_news_cached(
+        tuple(article['url'] for article in news_data),
+        tuple(article['title'] for article in news_data),
+        tuple(article['content'] for article in news_data)
+    )
+
+# Market status only depends on the wall clock at minute granularity, so
+# there is no point recomputing it on every rerun
+@st.cache_data(ttl=60, show_spinner=False)
+def market_status_cached():
+    return get_data_fetcher().get_market_status()
+
 # Sidebar configuration
 with st.sidebar:
     st.header("Configuration")
@@ -138,7 +188,7 @@ with st.sidebar:
     auto_refresh = st.checkbox("Enable Auto-refresh", value=True)
     
     # Market status
-    market_status = components['data_fetcher'].get_market_status()
+    market_status = market_status_cached()
     status_color = '#00CC00' if market_status else '#FF4B4B'
     status_text = 'OPEN' if market_status else 'CLOSED'
     
@@ -161,7 +211,10 @@ tab1, tab2, tab3, tab4 = st.tabs([
     "News Feed"
 ])
 
-with tab1:
+# Each tab body is a fragment, so interactions inside a tab (button
+# clicks, symbol selection) rerun only that tab instead of the whole script
+@st.fragment
+def render_trading_signals():
     st.subheader("Trading Signals")
     
     # Create columns for each symbol
@@ -169,31 +222,35 @@ with tab1:
     
     if st.button("Refresh Signals", type="primary"):
         with st.spinner("Updating signals..."):
+            # Prefetch all symbols in one parallel batch instead of one
+            # round-trip per column
+            stock_map = fetch_stock_data_many_cached(tuple(symbols))
+            news_map = fetch_news_many_cached(tuple(symbols))
+
             for idx, symbol in enumerate(symbols):
                 try:
                     with cols[idx]:
                         st.markdown(f"""
-                        <div style='background-color: #1E1E1E; 
-                                    padding: 1rem; 
-                                    border-radius: 0.5rem; 
+                        <div style='background-color: #1E1E1E;
+                                    padding: 1rem;
+                                    border-radius: 0.5rem;
                                     text-align: center;'>
                             <h3>{symbol}</h3>
                             <div>Fetching data...</div>
                         </div>
                         """, unsafe_allow_html=True)
-                        
-                        # Fetch data
-                        stock_data = components['data_fetcher'].fetch_stock_data(symbol)
-                        news_data = components['data_fetcher'].fetch_news(symbol)
-                        
-                        if stock_data.empty:
+
+                        stock_data = stock_map.get(symbol)
+                        news_data = news_map.get(symbol, [])
+
+                        if stock_data is None or stock_data.empty:
                             raise ValueError("No stock data available")
                         
                         # Analyze sentiment
-                        sentiment_results = components['sentiment_analyzer'].analyze_news_batch(news_data)
+                        sentiment_results = analyze_news_cached(news_data)
                         
                         # Generate signal
-                        signal = components['signal_generator'].generate_signal(
+                        signal = get_signal_generator().generate_signal(
                             sentiment_data=sentiment_results,
                             price_data=stock_data
                         )
@@ -233,7 +290,10 @@ with tab1:
     else:
         st.info("Click 'Refresh Signals' to fetch real-time trading signals")
 
-with tab2:
+@st.fragment
+def render_sentiment_analysis():
+    import plotly.graph_objects as go
+
     st.subheader("Sentiment Analysis")
     
     # Select symbol for detailed sentiment analysis
@@ -243,8 +303,8 @@ with tab2:
         with st.spinner("Analyzing sentiment..."):
             try:
                 # Fetch and analyze news
-                news_data = components['data_fetcher'].fetch_news(selected_symbol)
-                sentiment_results = components['sentiment_analyzer'].analyze_news_batch(news_data)
+                news_data = fetch_news_cached(selected_symbol)
+                sentiment_results = analyze_news_cached(news_data)
                 
                 if not news_data:
                     st.warning(f"No recent news found for {selected_symbol}")
@@ -307,7 +367,11 @@ with tab2:
             except Exception as e:
                 st.error(f"Error analyzing sentiment: {str(e)}")
 
-with tab3:
+@st.fragment
+def render_price_charts():
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
     st.subheader("Price Charts")
     
     # Select symbol for price chart
@@ -317,11 +381,27 @@ with tab3:
         with st.spinner("Updating chart..."):
             try:
                 # Fetch price data
-                stock_data = components['data_fetcher'].fetch_stock_data(chart_symbol)
+                stock_data = fetch_stock_data_cached(chart_symbol)
                 
                 if stock_data.empty:
                     st.warning(f"No price data available for {chart_symbol}")
                 else:
+                    # Thin long intraday series to 15-minute bars and send
+                    # float32/int32 to Plotly: every value is JSON-serialized
+                    # for the browser, so fewer and narrower points render
+                    # noticeably faster with no visible difference
+                    chart_data = stock_data
+                    if len(chart_data) > 500:
+                        chart_data = chart_data.resample('15min').agg({
+                            'open': 'first',
+                            'high': 'max',
+                            'low': 'min',
+                            'close': 'last',
+                            'volume': 'sum'
+                        }).dropna()
+                    ohlc = chart_data[['open', 'high', 'low', 'close']].astype('float32')
+                    volume = chart_data['volume'].astype('int32')
+
                     # Create candlestick chart with volume
                     fig = make_subplots(
                         rows=2, cols=1,
@@ -334,31 +414,32 @@ with tab3:
                     # Add candlestick chart
                     fig.add_trace(
                         go.Candlestick(
-                            x=stock_data.index,
-                            open=stock_data['open'],
-                            high=stock_data['high'],
-                            low=stock_data['low'],
-                            close=stock_data['close'],
+                            x=chart_data.index,
+                            open=ohlc['open'],
+                            high=ohlc['high'],
+                            low=ohlc['low'],
+                            close=ohlc['close'],
                             name='OHLC'
                         ),
                         row=1, col=1
                     )
-                    
+
                     # Add volume bars
                     fig.add_trace(
                         go.Bar(
-                            x=stock_data.index,
-                            y=stock_data['volume'],
+                            x=chart_data.index,
+                            y=volume,
                             name='Volume'
                         ),
                         row=2, col=1
                     )
-                    
-                    # Update layout
+
+                    # Update layout (uirevision keeps zoom/pan state across refreshes)
                     fig.update_layout(
                         height=800,
                         xaxis_rangeslider_visible=False,
-                        template="plotly_dark"
+                        template="plotly_dark",
+                        uirevision='constant'
                     )
                     
                     st.plotly_chart(fig, use_container_width=True)
@@ -379,7 +460,8 @@ with tab3:
             except Exception as e:
                 st.error(f"Error creating chart: {str(e)}")
 
-with tab4:
+@st.fragment
+def render_news_feed():
     st.subheader("News Feed")
     
     # Select symbol for news
@@ -389,7 +471,7 @@ with tab4:
         with st.spinner("Fetching news..."):
             try:
                 # Fetch news
-                news_data = components['data_fetcher'].fetch_news(news_symbol)
+                news_data = fetch_news_cached(news_symbol)
                 
                 # Display news articles
                 for news in news_data:
@@ -405,6 +487,15 @@ with tab4:
             except Exception as e:
                 st.error(f"Error fetching news: {str(e)}")
 
+with tab1:
+    render_trading_signals()
+with tab2:
+    render_sentiment_analysis()
+with tab3:
+    render_price_charts()
+with tab4:
+    render_news_feed()
+
 # Footer
 st.markdown("---")
 st.markdown("""
@@ -415,6 +506,8 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Auto-refresh functionality
+# st_autorefresh re-runs the script on a timer without blocking a worker
+# thread the way time.sleep + rerun did
 if auto_refresh:
     refresh_seconds = {
         "1 minute": 60,
@@ -423,7 +516,5 @@ if auto_refresh:
         "30 minutes": 1800,
         "1 hour": 3600
     }[refresh_interval]
-    
-    st.empty()
-    time.sleep(refresh_seconds)
-    st.experimental_rerun() 
\ No newline at end of file
+
+    st_autorefresh(interval=refresh_seconds * 1000, key="global_refresh")
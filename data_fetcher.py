@@ -1,5 +1,9 @@
 import os
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import pandas as pd
 from typing import List, Dict, Any
@@ -17,6 +21,22 @@ class DataFetcher:
         self.alpha_vantage_key = os.getenv('ALPHA_VANTAGE_API_KEY')
         self.news_api_key = os.getenv('NEWS_API_KEY')
         self.logger = logging.getLogger(__name__)
+
+        # Reuse one session so repeated HTTPS calls keep the TCP/TLS connection
+        # alive; retry transient API failures with backoff instead of surfacing
+        # them straight to the UI
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=(429, 500, 502, 503, 504))
+        )
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'User-Agent': 'StockSense/1.0',
+            'Accept-Encoding': 'gzip'
+        })
         
         # Validate API keys
         if not self.alpha_vantage_key:
@@ -44,15 +64,17 @@ class DataFetcher:
             url = f'https://www.alphavantage.co/query?function=TIME_SERIES_INTRADAY&symbol={symbol}&interval=5min&apikey={self.alpha_vantage_key}'
             
             self.logger.info(f"Making request to: {url}")
-            response = requests.get(url)
+            response = self.session.get(url, timeout=(3.05, 10))
             
             # Check response status
             if response.status_code != 200:
                 self.logger.error(f"API request failed with status code {response.status_code}")
                 self.logger.error(f"Response content: {response.text}")
                 raise ValueError(f"API request failed: {response.text}")
-            
-            data = response.json()
+
+            # orjson parses the ~200 KB intraday payload several times faster
+            # than stdlib json
+            data = orjson.loads(response.content)
             
             # Log the response structure
             self.logger.info(f"API Response keys: {data.keys()}")
@@ -68,17 +90,18 @@ class DataFetcher:
             
             # Convert to DataFrame
             df = pd.DataFrame.from_dict(data['Time Series (5min)'], orient='index')
-            
+
             # Rename columns
             df.columns = ['open', 'high', 'low', 'close', 'volume']
-            
-            # Convert string values to float
-            for col in df.columns:
-                df[col] = pd.to_numeric(df[col].str.replace(r'[^\d.]', ''), errors='coerce')
-            
+
+            # Alpha Vantage returns clean decimal strings, so a single astype
+            # covers the whole frame instead of a per-cell regex pass
+            df = df.astype({'open': 'float64', 'high': 'float64', 'low': 'float64',
+                            'close': 'float64', 'volume': 'int64'})
+
             # Add date index
             df.index = pd.to_datetime(df.index)
-            
+
             # Sort by date
             df = df.sort_index()
             
@@ -115,15 +138,15 @@ class DataFetcher:
             }
             
             self.logger.info(f"Making request to News API with params: {params}")
-            response = requests.get(url, params=params)
+            response = self.session.get(url, params=params, timeout=(3.05, 10))
             
             # Check response status
             if response.status_code != 200:
                 self.logger.error(f"News API request failed with status code {response.status_code}")
                 self.logger.error(f"Response content: {response.text}")
                 raise ValueError(f"News API request failed: {response.text}")
-            
-            data = response.json()
+
+            data = orjson.loads(response.content)
             
             if data.get('status') != 'ok':
                 self.logger.error(f"News API error: {data.get('message', 'Unknown error')}")
@@ -133,20 +156,24 @@ class DataFetcher:
                 self.logger.error("No articles found in API response")
                 return []
             
-            # Format news articles
-            news = []
-            for article in data['articles']:
-                if not article['description']:
-                    continue
-                    
-                news_item = {
+            # Format news articles; all timestamps are parsed in one
+            # vectorized pass instead of a per-article strptime
+            valid_articles = [a for a in data['articles'] if a['description']]
+            dates = pd.to_datetime(
+                [a['publishedAt'] for a in valid_articles],
+                format='%Y-%m-%dT%H:%M:%SZ'
+            ).to_pydatetime()
+
+            news = [
+                {
                     'title': article['title'],
                     'content': article['description'],
                     'source': article['source']['name'],
-                    'date': datetime.strptime(article['publishedAt'], '%Y-%m-%dT%H:%M:%SZ'),
+                    'date': published,
                     'url': article['url']
                 }
-                news.append(news_item)
+                for article, published in zip(valid_articles, dates)
+            ]
             
             self.logger.info(f"Successfully fetched {len(news)} news articles for {symbol}")
             return news
@@ -155,6 +182,51 @@ class DataFetcher:
             self.logger.error(f"Error fetching news for {symbol}: {str(e)}")
             raise
     
+    def fetch_stock_data_many(self, symbols: List[str]) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch stock data for several symbols in parallel.
+
+        Alpha Vantage only accepts one symbol per request, so the requests are
+        fanned out over a thread pool to hide the per-request latency instead
+        of paying it serially for every symbol.
+
+        Args:
+            symbols (List[str]): Stock symbols
+
+        Returns:
+            Dict[str, pd.DataFrame]: Stock data keyed by symbol (failed symbols are omitted)
+        """
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(8, len(symbols))) as executor:
+            futures = {executor.submit(self.fetch_stock_data, s): s for s in symbols}
+            for future, symbol in futures.items():
+                try:
+                    results[symbol] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error fetching stock data for {symbol}: {str(e)}")
+        return results
+
+    def fetch_news_many(self, symbols: List[str], limit: int = 10) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch news for several symbols in parallel.
+
+        Args:
+            symbols (List[str]): Stock symbols
+            limit (int): Number of articles to fetch per symbol
+
+        Returns:
+            Dict[str, List[Dict]]: News articles keyed by symbol (failed symbols are omitted)
+        """
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(8, len(symbols))) as executor:
+            futures = {executor.submit(self.fetch_news, s, limit): s for s in symbols}
+            for future, symbol in futures.items():
+                try:
+                    results[symbol] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error fetching news for {symbol}: {str(e)}")
+        return results
+
     def get_market_status(self) -> bool:
         """
         Check if the market is open based on current time.
@@ -180,8 +252,8 @@ class DataFetcher:
         try:
             # Finnhub API endpoint
             url = f'https://finnhub.io/api/v1/stock/profile2?symbol={symbol}&token={self.finnhub_key}'
-            response = requests.get(url)
-            return response.json()
+            response = self.session.get(url, timeout=(3.05, 10))
+            return orjson.loads(response.content)
             
         except Exception as e:
             self.logger.error(f"Error fetching company info for {symbol}: {str(e)}")
